@@ -5,10 +5,15 @@ HotOrColdGolf - A history golf game by Gavin An!
 (This game is absolute doodoo by the way)
 """
 
+from bisect import bisect_left
 from enum import Enum
-from random import randint
+from random import Random
 from random import choice
 
+# Shared RNG for swings; seed _RNG to make swings repeatable
+_RNG = Random()
+_randrange = _RNG.randrange
+
 class Temp(Enum):
     CORRECT = 0
     EXTREMELY_HOT = 1 # within three years
@@ -19,6 +24,25 @@ class Temp(Enum):
     VERY_COLD = 6 # within one hundred to two hundred fifty years
     EXTREMELY_COLD = 7 # beyond two hundred fifty years off
 
+# Upper bound (inclusive) of how many years off each Temp is, in order
+_THRESHOLDS = (0, 3, 10, 25, 50, 100, 250)
+_TEMPS = (Temp.CORRECT, Temp.EXTREMELY_HOT, Temp.VERY_HOT, Temp.KINDA_HOT,
+          Temp.LUKEWARM, Temp.KINDA_COLD, Temp.VERY_COLD, Temp.EXTREMELY_COLD)
+
+# What to tell the player for every Temp other than CORRECT
+_MESSAGES = {
+    Temp.EXTREMELY_HOT: "HOT HOT HOT!",
+    Temp.VERY_HOT: "Burning hot!",
+    Temp.KINDA_HOT: "Hot!",
+    Temp.LUKEWARM: "Warm!",
+    Temp.KINDA_COLD: "Cold...",
+    Temp.VERY_COLD: "Freezing cold...",
+    Temp.EXTREMELY_COLD: "We're going to freeze to death...",
+}
+
+# Year intervals (inclusive) that count as bunkers
+_BUNKERS = ((1347, 1351), (1914, 1918), (1939, 1945))
+
 class Question:
     """
     A question for HotOrColdGolf.
@@ -28,6 +52,8 @@ class Question:
         _question: The text of the question itself.
         _answer: The correct year.
     """
+    __slots__ = ('_par', '_question', '_answer')
+
     _par: int
     _question: str
     _answer: int
@@ -78,23 +104,35 @@ class Question:
             The Temp enum corresponding
             to how close the guess is
         """
-        off_by = abs(self.answer - guess)
-        if (off_by == 0):
-            return Temp.CORRECT
-        elif (off_by <= 3):
-            return Temp.EXTREMELY_HOT
-        elif (off_by <= 10):
-            return Temp.VERY_HOT
-        elif (off_by <= 25):
-            return Temp.KINDA_HOT
-        elif (off_by <= 50):
-            return Temp.LUKEWARM
-        elif (off_by <= 100):
-            return Temp.KINDA_COLD
-        elif (off_by <= 250):
-            return Temp.VERY_COLD
-        else:
-            return Temp.EXTREMELY_COLD
+        return _TEMPS[bisect_left(_THRESHOLDS, abs(self._answer - guess))]
+
+
+def _swing_core(start: int, target: int, rng: int, acc: int,
+                in_bunker: bool, is_sand_wedge: bool) -> int:
+    """
+    Computes where a swing lands. The range
+    check is left to Club.swing.
+
+    Args:
+        start: the starting year
+        target: the target year
+        rng: the range of the club
+        acc: the plus/minus accuracy of the club
+        in_bunker: whether the swing is from a bunker
+        is_sand_wedge: whether the club is a sand wedge
+
+    Returns:
+        The end year
+    """
+    if (in_bunker and not is_sand_wedge):
+        rng = 10
+
+    if target > start:
+        return max(start, min(start + rng, target + _randrange(-acc, acc + 1)))
+    elif target < start:
+        return min(start, max(start - rng, target + _randrange(-acc, acc + 1)))
+    else:
+        return target
 
 
 class Club:
@@ -106,6 +144,8 @@ class Club:
         _range: The range of the club in years.
         _accuracy: The plus/minus accuracy of the club.
     """
+    __slots__ = ('_name', '_range', '_accuracy', '_is_sand_wedge')
+
     _name: str
     _range: int
     _accuracy: int
@@ -168,23 +208,9 @@ class Club:
         """
         if (abs(start - target) > self.range):
             raise ValueError('That target is beyond the range of this club!')
-        else:
-            if (in_bunker and not self.is_sand_wedge):
-                minimum = start - 10
-                maximum = start + 10
-            else:
-                minimum = start - self.range
-                maximum = start + self.range
-
-            if target > start:
-                return max(start, min(maximum, target +
-                                      randint(-self.accuracy,self.accuracy)))
-            elif target < start:
-                return min(start, max(minimum, target +
-                                      randint(-self.accuracy,self.accuracy)))
-            else:
-                return target
-            
+        return _swing_core(start, target, self._range, self._accuracy,
+                           in_bunker, self._is_sand_wedge)
+
     def __str__(self) -> str:
         """
         Returns: A string representation of the club
@@ -216,7 +242,8 @@ class HotOrColdGolf:
 
     Attributes:
         _golf_bag: Set of all the clubs
-        _question_bag: Set of all the questions
+        _clubs_by_name: The clubs keyed by lowercase name
+        _question_bag: Tuple of all the questions
         _curr_club: Current club used
         _curr_question: Current question used
         _curr_year: Current year
@@ -224,7 +251,8 @@ class HotOrColdGolf:
     """
 
     _golf_bag: list[Club]
-    _question_bag: set[Question]
+    _clubs_by_name: dict[str, Club]
+    _question_bag: tuple[Question, ...]
     _curr_club: Club
     _curr_question: Question
     _curr_year: int
@@ -253,16 +281,18 @@ class HotOrColdGolf:
         self._golf_bag = [driver, three_wood, five_wood, three_iron, four_iron,
                           five_iron, six_iron, seven_iron, eight_iron,
                           nine_iron, pitching_wedge, sand_wedge, putter]
+        self._clubs_by_name = {club.name.lower(): club
+                               for club in self._golf_bag}
         
         henry_vii = Question(11, "This year saw the coronation of the king who would divorce, behead, and eventually... die!", 1509)
         charles_ii = Question(7, "This year saw the restoration of the 'one hundred percent party animal', also known as the King of Bling.", 1660)
         george_iv = Question(13, "This year saw the coronation of 'the fat one.'", 1820)
         world_war_one = Question(9, "This year, František and Stanislav flew sortie after sortie!", 1940)
         owen_glyndwr = Question(8, "This year, a Welsh noble rose up against England! (Also, Baron Grey De Ruthen spread untrue things about him.)", 1400)
-        self._question_bag = {henry_vii, charles_ii, george_iv, world_war_one, owen_glyndwr}
+        self._question_bag = (henry_vii, charles_ii, george_iv, world_war_one, owen_glyndwr)
 
         self._curr_club = driver
-        self._curr_question = choice(list(self._question_bag))
+        self._curr_question = choice(self._question_bag)
         self._curr_year = 0
         self._num_guesses = 0
         self._in_bunker = False
@@ -363,14 +393,9 @@ class HotOrColdGolf:
             print(e)
             return
         result = self.curr_question.evaluate_guess(actual)
-        bunker_intervals = {(1347, 1351), (1914, 1918), (1939, 1945)}
-        for bunker in bunker_intervals:
-            if (bunker[0] <= actual <= bunker[1]):
-                self._in_bunker = True
-                print("Oh no, you're in a bunker! Use a sand wedge to escape!")
-                break
-            else:
-                self._in_bunker = False
+        self._in_bunker = any(lo <= actual <= hi for lo, hi in _BUNKERS)
+        if (self._in_bunker):
+            print("Oh no, you're in a bunker! Use a sand wedge to escape!")
         print("You swung with the", self.curr_club.name, "and landed in the year", actual)
         self._curr_year = actual
         if (result == Temp.CORRECT):
@@ -379,20 +404,69 @@ class HotOrColdGolf:
             print("You scored", self.curr_question.par - self.num_guesses, "points!")
             print("See you next time!")
             exit(0)
-        elif (result == Temp.EXTREMELY_HOT):
-            print("HOT HOT HOT!")
-        elif (result == Temp.VERY_HOT):
-            print("Burning hot!")
-        elif (result == Temp.KINDA_HOT):
-            print("Hot!")
-        elif (result == Temp.LUKEWARM):
-            print("Warm!")
-        elif (result == Temp.KINDA_COLD):
-            print("Cold...")
-        elif (result == Temp.VERY_COLD):
-            print("Freezing cold...")
-        elif (result == Temp.EXTREMELY_COLD):
-            print("We're going to freeze to death...")
+        else:
+            print(_MESSAGES[result])
+
+def _do_target(game: HotOrColdGolf, arg: str) -> None:
+    """
+    Handles the target command
+
+    Args:
+        game: The game being played
+        arg: The year to target
+    """
+    try:
+        year = int(arg)
+        game.guess(year)
+    except ValueError:
+        print("Invalid year!")
+
+
+def _do_club(game: HotOrColdGolf, arg: str) -> None:
+    """
+    Handles the club command
+
+    Args:
+        game: The game being played
+        arg: The name of the club to change to
+    """
+    club = game._clubs_by_name.get(arg.lower())
+    if (club is None):
+        print("Club not found!")
+    else:
+        game.change_club(club)
+        print("Changed club to", club.name)
+
+
+def _do_quit(game: HotOrColdGolf, arg: str) -> bool:
+    """
+    Handles the quit command
+
+    Returns: True, to stop the command loop
+    """
+    print("Thanks for playing!")
+    return True
+
+
+def _unknown(game: HotOrColdGolf, arg: str) -> None:
+    """
+    Handles any command that isn't recognized
+    """
+    print("Invalid command!")
+
+
+# Command word -> handler taking the game and the rest of the command.
+# A handler returns True to stop the command loop.
+HANDLERS = {
+    "help": lambda game, arg: game.help(),
+    "clubs": lambda game, arg: game.print_clubs(),
+    "question": lambda game, arg: game.print_question(),
+    "year": lambda game, arg: game.print_year(),
+    "target": _do_target,
+    "club": _do_club,
+    "quit": _do_quit,
+}
+
 
 def main():
     """
@@ -407,36 +481,9 @@ def main():
     print("Good luck!")
     while True:
         command = input("Enter a command: ")
-        if (command == "help"):
-            game.help()
-        elif (command == "clubs"):
-            game.print_clubs()
-        elif (command == "question"):
-            game.print_question()
-        elif (command == "year"):
-            game.print_year()
-        elif (command.startswith("target ")):
-            try:
-                year = int(command.split(" ")[1])
-                game.guess(year)
-            except ValueError:
-                print("Invalid year!")
-        elif (command.startswith("club ")):
-            club_name = command.split(" ")[1]
-            found = False
-            for club in game._golf_bag:
-                if (club.name.lower() == club_name.lower()):
-                    game.change_club(club)
-                    print("Changed club to", club.name)
-                    found = True
-                    break
-            if (not found):
-                print("Club not found!")
-        elif (command == "quit"):
-            print("Thanks for playing!")
+        cmd, _, arg = command.partition(" ")
+        if (HANDLERS.get(cmd, _unknown)(game, arg)):
             break
-        else:
-            print("Invalid command!")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file